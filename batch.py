@@ -0,0 +1,206 @@
+
+import os
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from langchain.globals import set_llm_cache
+from langchain_community.cache import InMemoryCache
+from langchain_community.callbacks.openai_info import OpenAICallbackHandler
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+import tools1
+from main1 import build_agent, llm
+
+
+# Batch mode: answers many questions without the chat UI, e.g. for nightly QA
+# regression runs or to precompute answers for popular localities.
+#
+#   python batch.py questions.jsonl answers.jsonl --workers 8 --llm-requests-per-second 5 --api-requests-per-second 10
+#
+# Each input line is {"id": ..., "question": ...}; "id" defaults to "line-<n>" and
+# must be unique. Results are appended to the output file as soon as they finish,
+# and that file doubles as the checkpoint: rerunning the same command skips
+# questions whose ids are already in it. With --retry-errors an id can have
+# several rows; the last row for an id is the one that counts.
+
+
+def read_questions(path):
+    """Return (id, question) pairs from a JSONL file, rejecting duplicate ids."""
+    questions, seen = [], set()
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            item_id = str(item["id"]) if "id" in item else f"line-{line_no}"
+            if item_id in seen:
+                raise ValueError(f"{path}:{line_no}: duplicate question id {item_id!r}")
+            seen.add(item_id)
+            questions.append((item_id, item["question"]))
+    return questions
+
+
+def load_checkpoint(path, retry_errors=False):
+    """Return the ids in the output file that don't need answering again.
+
+    The last row for each id wins, so a successful retry replaces an earlier error."""
+    latest = {}
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial line from an interrupted run
+            latest[result["id"]] = result
+    return {item_id for item_id, result in latest.items() if not (retry_errors and result.get("error"))}
+
+
+class UsageStats(OpenAICallbackHandler):
+    """The handler behind get_openai_callback, except that answers served from the
+    LLM cache are counted in cache_hits instead of being charged again at the
+    usage stored with them. successful_requests counts only real API calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.cache_hits = 0
+
+    def on_llm_end(self, response, **kwargs):
+        # Cache hits come back without llm_output
+        if response.llm_output is None:
+            self.cache_hits += 1
+            return
+        super().on_llm_end(response, **kwargs)
+
+
+def ensure_trailing_newline(path):
+    """Finish a partial last line left by a killed run, so the next result
+    appended to the file starts on its own line."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+    if last != b"\n":
+        with open(path, "ab") as f:
+            f.write(b"\n")
+
+
+def answer_question(agent_llm, item_id, question):
+    """Run one question through a fresh agent and record latency and token usage."""
+    start = time.perf_counter()
+    answer, error = None, None
+    usage = UsageStats()
+    try:
+        agent = build_agent(agent_llm, verbose=False)
+        answer = agent.run(question, callbacks=[usage])
+    except Exception as e:
+        error = str(e)
+    return {
+        "id": item_id,
+        "question": question,
+        "answer": answer,
+        "error": error,
+        "latency": round(time.perf_counter() - start, 3),
+        "api_requests": usage.successful_requests,
+        "cache_hits": usage.cache_hits,
+        "prompt_tokens": usage.prompt_tokens,
+        "prompt_tokens_cached": usage.prompt_tokens_cached,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+        "total_cost": usage.total_cost,
+    }
+
+
+def run_batch(input_path, output_path, workers=4, llm_requests_per_second=None, api_requests_per_second=None,
+              use_cache=True, retry_errors=False):
+    done = load_checkpoint(output_path, retry_errors)
+    pending = [(item_id, q) for item_id, q in read_questions(input_path) if item_id not in done]
+    logging.info(f"Batch: {len(pending)} questions to answer, {len(done)} already done")
+    print(f"{len(pending)} questions to answer ({len(done)} already done)")
+
+    # All workers share one LLM client, the tools1 HTTP pool and the LLM cache
+    tools1.set_http_pool_size(workers)
+    if use_cache:
+        set_llm_cache(InMemoryCache())
+    agent_llm = llm
+    if llm_requests_per_second:
+        limiter = InMemoryRateLimiter(requests_per_second=llm_requests_per_second, max_bucket_size=workers)
+        agent_llm = llm.model_copy(update={"rate_limiter": limiter})
+    if api_requests_per_second:
+        tools1.session.rate_limiter = InMemoryRateLimiter(
+            requests_per_second=api_requests_per_second, max_bucket_size=workers
+        )
+
+    completed = failed = 0
+    written = set()
+    start = time.perf_counter()
+    ensure_trailing_newline(output_path)
+    with open(output_path, "a", encoding="utf-8") as out:
+
+        def write_result(future):
+            # Only this thread writes, so lines from different workers never interleave
+            nonlocal completed, failed
+            result = future.result()
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            written.add(future)
+            completed += 1
+            if result["error"]:
+                failed += 1
+                logging.error(f"Batch question {result['id']} failed: {result['error']}")
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = [pool.submit(answer_question, agent_llm, item_id, q) for item_id, q in pending]
+        try:
+            for future in as_completed(futures):
+                write_result(future)
+                if completed % 50 == 0 or completed == len(futures):
+                    print(f"{completed}/{len(futures)} done, {failed} failed")
+        except BaseException:
+            running = sum(1 for f in futures if f.running())
+            print(f"Stopping: cancelling queued questions and waiting for {running} running ones to finish...")
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            # Save answers that finished during shutdown, so a rerun doesn't redo them
+            for future in futures:
+                if future not in written and not future.cancelled() and future.exception() is None:
+                    write_result(future)
+
+    elapsed = time.perf_counter() - start
+    logging.info(f"Batch finished: {completed} answered, {failed} failed in {elapsed:.1f}s")
+    print(f"Finished {completed} questions ({failed} failed) in {elapsed:.1f}s")
+    return completed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer a JSONL file of questions with the real estate agent.")
+    parser.add_argument("input", help="JSONL file with one {\"id\", \"question\"} object per line.")
+    parser.add_argument("output", help="JSONL file to append results to; also used to resume.")
+    parser.add_argument("--workers", type=int, default=4, help="Number of questions answered at the same time.")
+    parser.add_argument("--llm-requests-per-second", type=float, help="Limit on LLM requests per second across all workers.")
+    parser.add_argument("--api-requests-per-second", type=float,
+                        help="Limit on property API (BASE_URL) requests per second across all workers.")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the shared in-memory LLM cache.")
+    parser.add_argument("--retry-errors", action="store_true", help="Answer again questions that failed in a previous run.")
+    args = parser.parse_args()
+
+    run_batch(
+        args.input,
+        args.output,
+        workers=args.workers,
+        llm_requests_per_second=args.llm_requests_per_second,
+        api_requests_per_second=args.api_requests_per_second,
+        use_cache=not args.no_cache,
+        retry_errors=args.retry_errors,
+    )
+
+
+if __name__ == "__main__":
+    main()
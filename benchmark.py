@@ -0,0 +1,267 @@
+
+import os
+import json
+import math
+import time
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from fake_models import FakeChatModel, FakeEmbeddings
+from mock_ppapi import MockPPAPIServer
+
+
+# Offline benchmark for the real estate agent.
+# Runs the real agent (main1.build_agent) and tools (tools1.tools) against the
+# local mock ppapi server with fake chat/embedding models, replaying the
+# conversations in a scenario file.
+#
+#   python benchmark.py scenarios/sample_conversations.json --concurrency 8
+
+
+# The TurnStats of the turn running on each worker thread; tool calls run on the
+# same thread as agent.run, so the HTTP hook below can find the right turn
+current_turn = threading.local()
+
+
+def count_http_call(response, *args, **kwargs):
+    """requests response hook on tools1.session: counts real HTTP calls per turn."""
+    stats = getattr(current_turn, "stats", None)
+    if stats is not None:
+        stats.http_calls += 1
+        if response.status_code >= 400:
+            stats.http_errors += 1
+    return response
+
+
+def is_tool_error(output):
+    """The tools in tools1.py report failures as "Error..."/"HTTP error..." strings
+    or {"Error": ...} dicts rather than raising."""
+    if isinstance(output, dict):
+        return "Error" in output
+    return str(output).startswith(("Error", "HTTP error occurred"))
+
+
+class TurnStats(BaseCallbackHandler):
+    """Counts LLM calls, tool calls, HTTP calls and token usage for a single agent turn."""
+
+    def __init__(self, retrieval_tool_name):
+        self.retrieval_tool_name = retrieval_tool_name
+        self.llm_calls = 0
+        self.tool_calls = Counter()
+        self.tool_errors = 0
+        self.http_calls = 0  # filled in by count_http_call
+        self.http_errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.llm_calls += 1
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self.llm_calls += 1
+
+    def on_llm_end(self, response, **kwargs):
+        usage = (response.llm_output or {}).get("token_usage", {})
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+
+    def on_tool_start(self, serialized, input_str, **kwargs):
+        self.tool_calls[(serialized or {}).get("name", "unknown")] += 1
+
+    def on_tool_end(self, output, **kwargs):
+        if is_tool_error(output):
+            self.tool_errors += 1
+
+    def on_tool_error(self, error, **kwargs):
+        self.tool_errors += 1
+
+    def as_dict(self):
+        return {
+            "llm_calls": self.llm_calls,
+            "tool_calls_total": sum(self.tool_calls.values()),
+            "retrieval_calls": self.tool_calls[self.retrieval_tool_name],
+            "tool_calls": dict(self.tool_calls),
+            "tool_errors": self.tool_errors,
+            "http_calls": self.http_calls,
+            "http_errors": self.http_errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def load_scenario(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def setup_agent_factory(scenario, server_url, concurrency):
+    """Point tools1 at the mock server and fake embeddings, and return a factory
+    that builds a fresh agent (with its own memory and fake LLM) for a conversation."""
+    # main1 refuses to import without a key; none of the fakes use it
+    os.environ.setdefault("OPEN_AI_KEY", "offline-benchmark")
+    # main1 runs load_dotenv(), and .env turns on LangSmith tracing, which would post
+    # every run to the hosted API; load_dotenv doesn't override variables already set
+    os.environ["LANGCHAIN_TRACING_V2"] = "false"
+    import tools1
+    import main1
+
+    embeddings = FakeEmbeddings(**scenario.get("embeddings", {}))
+    tools1.BASE_URL = server_url
+    tools1.vector_store = tools1.load_faiss_db(tools1.faiss_db_path, embeddings=embeddings)
+    tools1.session.hooks["response"].append(count_http_call)
+    # Size the shared pool like batch.py does, so connections aren't discarded and
+    # reopened above the requests default of 10
+    tools1.set_http_pool_size(concurrency)
+
+    def make_agent(conversation):
+        # Scripts are per conversation and per turn, so identical follow-ups in
+        # different conversations (or turns) keep their own tool sequence
+        turns = [{"actions": t.get("actions", []), "answer": t.get("answer")} for t in conversation["turns"]]
+        llm = FakeChatModel(turns=turns, **scenario.get("llm", {}))
+        return main1.build_agent(llm, verbose=False), llm
+
+    return make_agent, tools1.retrieval_tool.name, embeddings
+
+
+def run_conversation(conversation, make_agent, retrieval_tool_name):
+    agent, llm = make_agent(conversation)
+    results = []
+    for index, turn in enumerate(conversation["turns"]):
+        llm.turn_index = index
+        stats = TurnStats(retrieval_tool_name)
+        current_turn.stats = stats
+        start = time.perf_counter()
+        error = None
+        try:
+            agent.run(turn["user"], callbacks=[stats])
+        except Exception as e:
+            error = str(e)
+        finally:
+            current_turn.stats = None
+        result = stats.as_dict()
+        result.update({
+            "conversation": conversation.get("id"),
+            "latency": time.perf_counter() - start,
+            "error": error,
+        })
+        results.append(result)
+    return results
+
+
+def run_benchmark(scenario, concurrency, repeat):
+    server_settings = scenario.get("server", {})
+    with MockPPAPIServer(
+        latency=server_settings.get("latency", 0.0),
+        jitter=server_settings.get("jitter", 0.0),
+        error_rate=server_settings.get("error_rate", 0.0),
+        endpoint_overrides=server_settings.get("endpoints"),
+        seed=server_settings.get("seed", 0),
+    ) as server:
+        make_agent, retrieval_tool_name, embeddings = setup_agent_factory(scenario, server.url, concurrency)
+        conversations = scenario["conversations"] * repeat
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(run_conversation, c, make_agent, retrieval_tool_name) for c in conversations]
+            turns = [turn for future in futures for turn in future.result()]
+        elapsed = time.perf_counter() - start
+
+        return summarize(turns, elapsed, concurrency, server.call_counts, embeddings.call_count)
+
+
+def summarize(turns, elapsed, concurrency, server_calls, embedding_calls):
+    latencies = [t["latency"] for t in turns]
+    n = len(turns) or 1
+
+    def per_turn(key):
+        return sum(t[key] for t in turns) / n
+
+    return {
+        "turns": len(turns),
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "throughput_turns_per_s": len(turns) / elapsed if elapsed else 0.0,
+        "latency_s": {
+            "mean": sum(latencies) / n,
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=0.0),
+        },
+        "per_turn": {
+            "llm_calls": per_turn("llm_calls"),
+            "tool_calls_total": per_turn("tool_calls_total"),
+            "retrieval_calls": per_turn("retrieval_calls"),
+            "tool_errors": per_turn("tool_errors"),
+            "http_calls": per_turn("http_calls"),
+            "http_errors": per_turn("http_errors"),
+            "prompt_tokens": per_turn("prompt_tokens"),
+            "completion_tokens": per_turn("completion_tokens"),
+        },
+        "failed_turns": sum(1 for t in turns if t["error"]),
+        "server_calls": server_calls,
+        "embedding_calls_total": embedding_calls,
+    }
+
+
+def print_report(report):
+    print(f"Turns: {report['turns']}  concurrency: {report['concurrency']}  "
+          f"elapsed: {report['elapsed_s']:.2f}s  failed: {report['failed_turns']}")
+    print(f"Throughput: {report['throughput_turns_per_s']:.2f} turns/s")
+    print("Latency (s): " + "  ".join(f"{k}={v:.3f}" for k, v in report["latency_s"].items()))
+    print("Per turn:    " + "  ".join(f"{k}={v:.2f}" for k, v in report["per_turn"].items()))
+    print(f"Embedding calls (all turns): {report['embedding_calls_total']}")
+    print("Mock server calls:")
+    for endpoint, count in sorted(report["server_calls"].items()):
+        print(f"  {endpoint:<32}{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for the real estate agent.")
+    parser.add_argument("scenario", help="Scenario JSON file with recorded conversations.")
+    parser.add_argument("--concurrency", type=int, help="Conversations run at the same time.")
+    parser.add_argument("--repeat", type=int, help="How many times to replay the conversations.")
+    parser.add_argument("--server-latency", type=float, help="Mock API latency in seconds.")
+    parser.add_argument("--error-rate", type=float, help="Fraction of mock API calls that fail with HTTP 500.")
+    parser.add_argument("--llm-latency", type=float, help="Fake LLM latency per call in seconds.")
+    parser.add_argument("--embedding-latency", type=float, help="Fake embedding latency per call in seconds.")
+    parser.add_argument("--output", help="Write the report as JSON to this file.")
+    args = parser.parse_args()
+
+    scenario = load_scenario(args.scenario)
+    for section, key, value in [
+        ("server", "latency", args.server_latency),
+        ("server", "error_rate", args.error_rate),
+        ("llm", "latency", args.llm_latency),
+        ("embeddings", "latency", args.embedding_latency),
+    ]:
+        if value is not None:
+            scenario.setdefault(section, {})[key] = value
+
+    concurrency = args.concurrency or scenario.get("concurrency", 1)
+    repeat = args.repeat or scenario.get("repeat", 1)
+    report = run_benchmark(scenario, concurrency, repeat)
+    report["scenario"] = scenario.get("name", os.path.basename(args.scenario))
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
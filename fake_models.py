@@ -0,0 +1,130 @@
+
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, List
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field
+
+
+# Deterministic stand-ins for ChatOpenAI and OpenAIEmbeddings, used by the
+# benchmark so the agent can run offline. Both sleep to mimic API latency.
+
+
+def count_tokens(text):
+    """Rough token estimate (about 4 characters per token, like OpenAI's models)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def stable_random(text):
+    """A Random seeded from the text, so the same input always gives the same output."""
+    return random.Random(hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+
+class FakeChatModel(BaseChatModel):
+    """Replays scripted ReAct steps for the ZERO_SHOT_REACT_DESCRIPTION agent.
+
+    turns holds one conversation's scripts, {"actions": [{"tool": ..., "input": ...}], "answer": ...},
+    and turn_index says which one the agent is on, so repeated follow-ups like "yes"
+    still get their own script. Use one instance per conversation.
+    Each call looks at how many observations the agent scratchpad already holds and
+    returns the next action, or the final answer once all actions are used up.
+    Turns without a script get a direct final answer."""
+
+    turns: List[Dict[str, Any]] = Field(default_factory=list)
+    turn_index: int = 0
+    latency: float = 0.4  # seconds per call
+    per_token_latency: float = 0.005  # seconds per generated token
+    jitter: float = 0.1  # +/- fraction of the delay
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        text = self._respond(prompt)
+        for token in stop or []:
+            text = text.split(token)[0]
+
+        prompt_tokens = count_tokens(prompt)
+        completion_tokens = count_tokens(text)
+        delay = self.latency + self.per_token_latency * completion_tokens
+        delay *= 1 + stable_random(prompt).uniform(-self.jitter, self.jitter)
+        time.sleep(max(0.0, delay))
+
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        message = AIMessage(
+            content=text,
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"token_usage": usage, "model_name": self._llm_type},
+        )
+
+    def _respond(self, prompt):
+        # The format instructions also contain "Question:", so take the last one
+        start = prompt.rfind("\nQuestion: ")
+        if start == -1 or "\nThought:" not in prompt[start:]:
+            # Not an agent prompt, e.g. generate_dynamic_suggestions in main1.py
+            return "\n".join([
+                "1. What are the properties near this location?",
+                "2. Can you show me price trends in this area?",
+                "3. Are there any RERA-approved projects here?",
+                "4. What’s the EMI for a property in this range?",
+            ])
+
+        question, _, scratchpad = prompt[start + len("\nQuestion: "):].partition("\nThought:")
+        question = question.strip()
+        script = self.turns[self.turn_index] if self.turn_index < len(self.turns) else {}
+        actions = script.get("actions", [])
+        step = scratchpad.count("\nObservation:")
+        if step < len(actions):
+            action = actions[step]
+            return (
+                f" I need to use {action['tool']} to answer this.\n"
+                f"Action: {action['tool']}\n"
+                f"Action Input: {action['input']}"
+            )
+        answer = script.get("answer") or f"Here is what I found about: {question}"
+        return f" I now know the final answer.\nFinal Answer: {answer}"
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic unit vectors derived from a hash of the text."""
+
+    def __init__(self, size=1536, latency=0.05):
+        self.size = size  # must match the FAISS index (1536 for faiss_index_all)
+        self.latency = latency
+        self.call_count = 0
+        self._lock = threading.Lock()
+
+    def _embed(self, text):
+        rng = stable_random(text)
+        vector = [rng.gauss(0, 1) for _ in range(self.size)]
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            self.call_count += 1
+        time.sleep(self.latency)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
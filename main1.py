@@ -43,15 +43,23 @@ memory = ConversationBufferWindowMemory(k=5, return_messages=True)
 def custom_error_handler(e):
     return f"Parsing error: {str(e)}"
 
+def build_agent(llm, memory=None, verbose=True):
+    """Builds the real estate agent around the given LLM and the tools from tools1.
+
+    Each call gets its own memory, so separate conversations can run side by side."""
+    if memory is None:
+        memory = ConversationBufferWindowMemory(k=5, return_messages=True)
+    return initialize_agent(
+        tools=tools,
+        llm=llm,
+        agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+        verbose=verbose,
+        handle_parsing_errors=custom_error_handler,
+        memory=memory,
+    )
+
 # Initialize agent (assuming tools is defined elsewhere)
-agent = initialize_agent(
-    tools=tools,  # Replace with actual tools if needed
-    llm=llm,
-    agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-    verbose=True,
-    handle_parsing_errors=custom_error_handler,
-    memory=memory,
-)
+agent = build_agent(llm, memory=memory)
 
 # Function to generate dynamic suggestions
 def generate_dynamic_suggestions(user_input):
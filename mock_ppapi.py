@@ -0,0 +1,217 @@
+
+import random
+import threading
+import time
+from collections import Counter
+
+from flask import Flask, jsonify, request
+from werkzeug.serving import make_server
+
+
+# Local stand-in for the ppapi.vercel.app Flask API used by tools1.py.
+# It serves every BASE_URL endpoint the tools call, with deterministic fake
+# listings, so the agent can be benchmarked without network access.
+# Latency and error injection are configurable globally or per endpoint.
+
+
+PROJECT_NAMES = [
+    "Sai Vanamali Phase 1",
+    "Lakshmis Emperia",
+    "Vertex Viraat",
+    "Aparna Sarovar Zenith",
+    "My Home Bhooja",
+    "Prestige High Fields",
+    "Rajapushpa Provincia",
+    "Honer Aquantis",
+]
+PROPERTY_TYPES = [
+    "Gated Community / Apartment",
+    "Stand Alone / Apartment",
+    "Villa",
+    "Independent House",
+]
+
+
+def fake_listings(seed_text, count=5, **fields):
+    """Generate deterministic property listings for the given query."""
+    rng = random.Random(seed_text)
+    listings = []
+    for _ in range(count):
+        bhk = rng.randint(1, 4)
+        listing = {
+            "project_name": rng.choice(PROJECT_NAMES),
+            "property_type": rng.choice(PROPERTY_TYPES),
+            "price_per_sqft": rng.randrange(4500, 15000, 50),
+            "size": round(rng.uniform(600, 3500), 2),
+            "bhk": bhk,
+            "pincode": str(rng.randint(500001, 500100)),
+            "address": f"{fields.get('locality') or fields.get('location') or 'Hyderabad'}, Hyderabad",
+            "city": "Hyderabad",
+            "rera_approved": rng.random() < 0.7,
+        }
+        listing.update({k: v for k, v in fields.items() if v is not None})
+        listings.append(listing)
+    return listings
+
+
+def create_app(latency=0.0, jitter=0.0, error_rate=0.0, endpoint_overrides=None, seed=0):
+    """Create the mock API.
+
+    latency/jitter are in seconds and error_rate is the fraction of requests
+    answered with HTTP 500. endpoint_overrides maps an endpoint name (e.g.
+    "market_value") to a dict overriding any of those three settings."""
+    app = Flask(__name__)
+    app.config["CALL_COUNTS"] = Counter()
+    endpoint_overrides = endpoint_overrides or {}
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    @app.before_request
+    def inject_latency_and_errors():
+        name = request.path.strip("/")
+        settings = {"latency": latency, "jitter": jitter, "error_rate": error_rate}
+        settings.update(endpoint_overrides.get(name, {}))
+        with lock:
+            app.config["CALL_COUNTS"][name] += 1
+            delay = max(0.0, settings["latency"] + rng.uniform(-settings["jitter"], settings["jitter"]))
+            fail = rng.random() < settings["error_rate"]
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return jsonify({"error": "Injected failure"}), 500
+
+    @app.route("/budget_properties")
+    def budget_properties():
+        locality = request.args.get("locality")
+        budget = request.args.get("budget", type=int)
+        listings = fake_listings(f"budget:{locality}:{budget}", locality=locality)
+        if budget:
+            listings = [p for p in listings if p["price_per_sqft"] * p["size"] <= budget] or listings[:1]
+        return jsonify(listings)
+
+    @app.route("/available_properties")
+    def available_properties():
+        location = request.args.get("location")
+        return jsonify(fake_listings(f"available:{location}", location=location))
+
+    @app.route("/market_value")
+    def market_value():
+        location = request.args.get("location")
+        category = request.args.get("property_category")
+        rng_local = random.Random(f"market:{location}:{category}")
+        return jsonify({
+            "location": location,
+            "property_category": category or "All",
+            "average_price_per_sqft": rng_local.randrange(4500, 15000, 50),
+            "min_price_per_sqft": rng_local.randrange(3000, 4500, 50),
+            "max_price_per_sqft": rng_local.randrange(15000, 25000, 50),
+        })
+
+    @app.route("/properties_near_it_hub")
+    def properties_near_it_hub():
+        hub_name = request.args.get("hub_name")
+        radius = request.args.get("radius", 2.0, type=float)
+        return jsonify(fake_listings(f"hub:{hub_name}:{radius}", hub_name=hub_name))
+
+    @app.route("/properties_near_metro_station")
+    def properties_near_metro_station():
+        station_name = request.args.get("station_name")
+        radius = request.args.get("radius", 2.0, type=float)
+        return jsonify(fake_listings(f"metro:{station_name}:{radius}", station_name=station_name))
+
+    @app.route("/properties_near")
+    def properties_near():
+        latitude = request.args.get("latitude", type=float)
+        longitude = request.args.get("longitude", type=float)
+        radius = request.args.get("radius", 2.0, type=float)
+        return jsonify(fake_listings(f"near:{latitude}:{longitude}:{radius}"))
+
+    @app.route("/rera_approved")
+    def rera_approved():
+        location = request.args.get("location")
+        project_name = request.args.get("project_name")
+        listings = fake_listings(f"rera:{location}:{project_name}", location=location, project_name=project_name)
+        for listing in listings:
+            listing["rera_approved"] = True
+        return jsonify(listings)
+
+    @app.route("/project_price")
+    def project_price():
+        project_name = request.args.get("project_name")
+        area = request.args.get("area", 1.0, type=float)
+        price_per_sqft = random.Random(f"price:{project_name}").randrange(4500, 15000, 50)
+        return jsonify({
+            "project_name": project_name,
+            "area": area,
+            "price_per_sqft": price_per_sqft,
+            "total_price": round(price_per_sqft * area, 2),
+        })
+
+    @app.route("/calculate_emi", methods=["POST"])
+    def calculate_emi():
+        data = request.get_json(force=True, silent=True) or {}
+        try:
+            loan_amount = float(data["loan_amount"])
+            months = int(float(data["tenure_years"]) * 12)
+            monthly_rate = float(data["annual_interest_rate"]) / 12 / 100
+        except (KeyError, TypeError, ValueError):
+            return jsonify({"error": "loan_amount, tenure_years and annual_interest_rate must be numbers"}), 400
+        if loan_amount <= 0 or months <= 0 or monthly_rate < 0:
+            return jsonify({"error": "Loan amount and tenure (at least one month) must be positive"}), 400
+        if monthly_rate:
+            emi = loan_amount * monthly_rate * (1 + monthly_rate) ** months / ((1 + monthly_rate) ** months - 1)
+        else:
+            emi = loan_amount / months
+        return jsonify({
+            "emi": round(emi, 2),
+            "total_interest": round(emi * months - loan_amount, 2),
+            "total_payment": round(emi * months, 2),
+        })
+
+    @app.route("/filter_properties/")
+    def filter_properties():
+        filters = {k: request.args.get(k) for k in ("city", "locality", "pincode", "property_category")}
+        filters["bhk"] = request.args.get("bhk", type=int)
+        page = request.args.get("page", 1, type=int)
+        page_size = request.args.get("page_size", 10, type=int)
+        seed_text = "filter:" + ":".join(f"{k}={v}" for k, v in sorted(filters.items()))
+        listings = fake_listings(seed_text, count=page_size, **filters)
+        return jsonify({"page": page, "page_size": page_size, "results": listings})
+
+    return app
+
+
+class MockPPAPIServer:
+    """Runs the mock API on a background thread. Use port=0 for a free port."""
+
+    def __init__(self, host="127.0.0.1", port=0, **app_kwargs):
+        self.app = create_app(**app_kwargs)
+        self._server = make_server(host, port, self.app, threaded=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://{self._server.host}:{self._server.port}"
+
+    @property
+    def call_counts(self):
+        return dict(self.app.config["CALL_COUNTS"])
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # python mock_ppapi.py  -> serves on http://127.0.0.1:5001
+    create_app(latency=0.05).run(port=5001, threaded=True)
@@ -2,6 +2,7 @@
 import os
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from langchain.prompts import PromptTemplate
 from langchain.agents import initialize_agent,Tool,AgentType
 from langchain.vectorstores import FAISS
@@ -16,11 +17,11 @@ from config import OPEN_AI_KEY
 faiss_db_path = "faiss_index_all"  # Directory for the FAISS vector database
 
 
-def load_faiss_db(faiss_db_path):
+def load_faiss_db(faiss_db_path, embeddings=None):
     if os.path.exists(faiss_db_path):
         vector_store = FAISS.load_local(
             faiss_db_path,
-            OpenAIEmbeddings(api_key=OPEN_AI_KEY),
+            embeddings or OpenAIEmbeddings(api_key=OPEN_AI_KEY),
             allow_dangerous_deserialization=True,
         )
         return vector_store
@@ -35,6 +36,27 @@ vector_store = load_faiss_db(faiss_db_path)
 # Flask API URL
 BASE_URL = "https://ppapi.vercel.app"
 
+class RateLimitedSession(requests.Session):
+    """requests.Session that can cap the request rate across all threads.
+
+    rate_limiter is anything with a blocking acquire(), e.g. langchain's InMemoryRateLimiter."""
+    rate_limiter = None
+
+    def request(self, *args, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+# Shared HTTP session, so every tool call (and every concurrent agent) reuses
+# pooled connections to the API instead of opening a new one per request
+session = RateLimitedSession()
+
+def set_http_pool_size(pool_size: int):
+    """Resize the shared connection pool, e.g. to match the number of batch workers."""
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
 # This tools are used by LangchainAgent
 # These tools are designed to interact with external APIs or perform specific tasks, 
 # and they are wrapped in a way that makes them compatible with the LangChain framework.
@@ -45,7 +67,7 @@ def budget_properties_tool(locality: str, budget: int):
     """Fetch available properties from the API based on location and budget."""
     try:
         params = {"locality": locality, "budget": budget}
-        response = requests.get(f"{BASE_URL}/budget_properties", params=params)
+        response = session.get(f"{BASE_URL}/budget_properties", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -68,7 +90,7 @@ def available_properties_tool(location: str):
     """Fetch available properties in a specific location."""
     try:
         params = {"location": location}
-        response = requests.get(f"{BASE_URL}/available_properties", params=params)
+        response = session.get(f"{BASE_URL}/available_properties", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -93,7 +115,7 @@ def market_value_tool(location: str, property_category: str = None):
         if property_category:
             params["property_category"] = property_category
         
-        response = requests.get(f"{BASE_URL}/market_value", params=params)
+        response = session.get(f"{BASE_URL}/market_value", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -116,7 +138,7 @@ def properties_near_it_hub(hub_name: str, radius: float = 2.0):
     """Fetch available properties near a specified IT hub within a given radius."""
     try:
         params = {"hub_name": hub_name, "radius": radius}
-        response = requests.get(f"{BASE_URL}/properties_near_it_hub", params=params)
+        response = session.get(f"{BASE_URL}/properties_near_it_hub", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -142,7 +164,7 @@ def properties_near_metro(station_name: str, radius: float = 2.0):
     """Fetch available properties near a metro station within a specified radius."""
     try:
         params = {"station_name": station_name, "radius": radius}
-        response = requests.get(f"{BASE_URL}/properties_near_metro_station", params=params)
+        response = session.get(f"{BASE_URL}/properties_near_metro_station", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -167,7 +189,7 @@ def properties_near(latitude: float, longitude: float, radius: float = 2.0):
     """Fetch available properties near a given latitude and longitude within a specified radius."""
     try:
         params = {"latitude": latitude, "longitude": longitude, "radius": radius}
-        response = requests.get(f"{BASE_URL}/properties_near", params=params)
+        response = session.get(f"{BASE_URL}/properties_near", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -197,7 +219,7 @@ def rera_approved_tool(location: str, project_name: str = None):
         if project_name:
             params["project_name"] = project_name  # Add project_name only if provided
 
-        response = requests.get(f"{BASE_URL}/rera_approved", params=params)
+        response = session.get(f"{BASE_URL}/rera_approved", params=params)
         response.raise_for_status()  # Raise an error for non-200 responses
         return response.json()
     
@@ -222,7 +244,7 @@ def project_price_tool(project_name: str, area: float = 1.0):
     """Fetch project price details based on the project name and area."""
     try:
         params = {"project_name": project_name, "area": area}
-        response = requests.get(f"{BASE_URL}/project_price", params=params)
+        response = session.get(f"{BASE_URL}/project_price", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -253,7 +275,7 @@ def calculate_emi_tool(loan_amount: float, tenure_years: float, annual_interest_
             "tenure_years": tenure_years,
             "annual_interest_rate": annual_interest_rate
         }
-        response = requests.post(f"{BASE_URL}/calculate_emi", json=payload)
+        response = session.post(f"{BASE_URL}/calculate_emi", json=payload)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err:
@@ -295,7 +317,7 @@ def filter_properties_tool(city=None, locality=None, pincode=None, property_cate
         # Remove None values from parameters
         params = {k: v for k, v in params.items() if v is not None}
         
-        response = requests.get(f"{BASE_URL}/filter_properties/", params=params)
+        response = session.get(f"{BASE_URL}/filter_properties/", params=params)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as http_err: